@@ -2,23 +2,28 @@
 
 
 import argparse
-import copy
-from typing import List, Union
+import functools
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Optional, Tuple
 
-import yaml
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 from loguru import logger
-from kafka import KafkaAdminClient
+
+if TYPE_CHECKING:
+    from kafka import KafkaAdminClient
 
 
 class SSLConfig(BaseModel):
     """SSL configuration.
     Attributes:
-        ca_file (str): Path to the CA file.
+        cafile (str): Path to the CA file.
         certfile (str): Path to the certificate file.
         keyfile (str): Path to the key file.
     """
 
+    model_config = ConfigDict(frozen=True, extra='forbid')
+
     cafile: str = Field(default=None)
     certfile: str = Field(default=None)
     keyfile: str = Field(default=None)
@@ -33,6 +38,8 @@ class SALSConfig(BaseModel):
         password (str): SASL password.
     """
 
+    model_config = ConfigDict(frozen=True, extra='forbid')
+
     mechanism: str = Field(default=None)
     username: str = Field(default=None)
     password: str = Field(default=None)
@@ -43,17 +50,63 @@ class KafkaClusterConfig(BaseModel):
 
     Attributes:
         description (str): Description of the cluster.
-        bootstrap_servers (Union[str, List[str]]): Bootstrap servers for the cluster.
+        bootstrap_servers (Tuple[str, ...]): Bootstrap servers for the cluster, given as a
+            single host:port string, a comma-separated string or a list of them.
         ssl (SSLConfig): SSL configuration.
         security_protocol (str): Security protocol.
         sasl (SALSConfig): SASL configuration.
     """
 
+    model_config = ConfigDict(frozen=True, extra='forbid')
+
     description: str = Field(default='')
-    bootstrap_servers: Union[str, List[str]] = Field()
-    ssl: SSLConfig = Field(default={})
+    bootstrap_servers: Tuple[str, ...] = Field()
+    ssl: SSLConfig = Field(default_factory=SSLConfig)
     security_protocol: str = Field(default='PLAINTEXT')
-    sasl: SALSConfig = Field(default={})
+    sasl: SALSConfig = Field(default_factory=SALSConfig)
+
+    @field_validator('bootstrap_servers', mode='before')
+    @classmethod
+    def _normalize_bootstrap_servers(cls, value):
+        """Accept a single host:port string, or a comma-separated list of them, as a tuple."""
+        if isinstance(value, str):
+            return tuple(server.strip() for server in value.split(',') if server.strip())
+
+        return value
+
+    @property
+    def admin_client_config(self) -> dict:
+        """Get the keyword arguments for the cluster's KafkaAdminClient.
+
+        Returns:
+            dict: KafkaAdminClient keyword arguments, built once per distinct config.
+        """
+        return _build_admin_client_config(self)
+
+
+@functools.lru_cache(maxsize=64)
+def _build_admin_client_config(config: KafkaClusterConfig) -> dict:
+    """Build the KafkaAdminClient keyword arguments for a cluster config.
+
+    The config is frozen, so it is keyed by its field values: a copy made with
+    ``model_copy(update=...)`` gets its own entry instead of a stale one.
+
+    Args:
+        config (KafkaClusterConfig): The cluster configuration.
+
+    Returns:
+        dict: KafkaAdminClient keyword arguments.
+    """
+    return dict(
+        bootstrap_servers=config.bootstrap_servers,
+        security_protocol=config.security_protocol,
+        ssl_cafile=config.ssl.cafile,
+        ssl_certfile=config.ssl.certfile,
+        ssl_keyfile=config.ssl.keyfile,
+        sasl_mechanism=config.sasl.mechanism,
+        sasl_plain_username=config.sasl.username,
+        sasl_plain_password=config.sasl.password,
+    )
 
 
 class KafkaClustersConfig(BaseModel):
@@ -62,9 +115,40 @@ class KafkaClustersConfig(BaseModel):
     Attributes:
         clusters (dict[str, KafkaClusterConfig]): Dictionary of cluster configurations.
     """
+
+    model_config = ConfigDict(frozen=True, extra='forbid')
+
     clusters: dict[str, KafkaClusterConfig] = Field(default={})
 
 
+@functools.lru_cache(maxsize=8)
+def _load_clusters_config(file_path: str, mtime_ns: int, size: int) -> KafkaClustersConfig:
+    """Load and validate the clusters configuration file.
+
+    The modification time and size of the file are part of the cache key, so
+    a changed file is parsed again while an unchanged one is served from cache.
+
+    Args:
+        file_path (str): Path to the configuration file.
+        mtime_ns (int): Modification time of the file in nanoseconds.
+        size (int): Size of the file in bytes.
+
+    Returns:
+        KafkaClustersConfig: Parsed configuration.
+    """
+    import yaml
+    try:
+        from yaml import CSafeLoader as SafeLoader
+    except ImportError:
+        from yaml import SafeLoader
+
+    # Hand libyaml the raw bytes so it does the decoding itself.
+    with open(file_path, 'rb') as f:
+        config = yaml.load(f, Loader=SafeLoader)
+
+    return KafkaClustersConfig(**config)
+
+
 class Core:
     """Core class for the mcp-kafka server.
 
@@ -78,7 +162,7 @@ class Core:
                     cluster_name:
                         bootstrap_servers: [host1:port1, host2:port2]
                         ssl:
-                            ca_file: path/to/ca.pem
+                            cafile: path/to/ca.pem
                             certfile: path/to/cert.pem
                             keyfile: path/to/key.pem
                         security_protocol: SASL_SSL
@@ -95,17 +179,19 @@ class Core:
     }
 
     def __init__(self, **configs):
-        logger.debug(f"Starting MCP Core with configuration: {configs}")
-        extra_configs = set(configs).difference(self.DEFAULT_CONFIG)
+        logger.debug('Starting MCP Core with configuration: {}', configs)
+        extra_configs = [key for key in configs if key not in self.DEFAULT_CONFIG]
         if extra_configs:
             raise KeyError(f"Unrecognized configs: {extra_configs}")
-        self.config = copy.copy(self.DEFAULT_CONFIG)
-        self.config.update(configs)
+        self.config = {**self.DEFAULT_CONFIG, **configs}
         if self.config['clusters_config_file']:
             clusters_config = self._parse_config_file(self.config['clusters_config_file'])
             self.config['clusters'] = clusters_config.clusters
 
+        self._clusters = self.config.get('clusters', {})
+        self._cluster_names = tuple(self._clusters)
         self._kafka_admin_clients = {}
+        self._kafka_admin_clients_by_conn = {}
 
     @staticmethod
     def from_flags():
@@ -132,6 +218,7 @@ class Core:
             port=args.port,
             clusters_config_file=args.clusters_config,
         )
+        core.prewarm()
 
         return core
 
@@ -142,13 +229,10 @@ class Core:
             file_path (str): Path to the configuration file.
 
         Returns:
-            dict: Parsed configuration.
+            KafkaClustersConfig: Parsed configuration.
         """
-        with open(file_path, 'r', encoding='utf-8') as f:
-            content = f.read()
-            config = yaml.safe_load(content)
-
-        return KafkaClustersConfig(**config)
+        stat = os.stat(file_path)
+        return _load_clusters_config(file_path, stat.st_mtime_ns, stat.st_size)
 
     @property
     def use_sse(self) -> bool:
@@ -169,13 +253,13 @@ class Core:
         return self.config['port']
 
     @property
-    def clusters(self) -> List[str]:
+    def clusters(self) -> Tuple[str, ...]:
         """Get the cluster names.
 
         Returns:
-            List[str]: List of cluster names.
+            Tuple[str, ...]: Tuple of cluster names.
         """
-        return self.config['clusters'].keys() if 'clusters' in self.config else []
+        return self._cluster_names
 
     def get_cluster_config(self, cluster_name: str) -> KafkaClusterConfig:
         """Get the configuration for a specific cluster.
@@ -186,15 +270,25 @@ class Core:
         Returns:
             ClusterConfig: The configuration for the specified cluster.
         """
-        if 'clusters' not in self.config:
-            raise KeyError('No clusters found in the configuration.')
+        try:
+            return self._clusters[cluster_name]
+        except KeyError:
+            raise KeyError(f"Cluster '{cluster_name}' not found in the configuration.") from None
+
+    def admin_client_key(self, cluster_name: str) -> tuple:
+        """Get the key of the admin client used by a cluster, without connecting.
+
+        Clusters with the same key share one admin client.
 
-        if cluster_name not in self.config['clusters']:
-            raise KeyError(f"Cluster '{cluster_name}' not found in the configuration.")
+        Args:
+            cluster_name (str): The name of the cluster.
 
-        return self.config['clusters'][cluster_name]
+        Returns:
+            tuple: The connection key of the cluster's admin client.
+        """
+        return self._connection_key(self.get_cluster_config(cluster_name))
 
-    def kafka_admin_client(self, cluster_name: str) -> KafkaAdminClient:
+    def kafka_admin_client(self, cluster_name: str) -> 'KafkaAdminClient':
         """Get the Kafka admin client.
 
         Returns:
@@ -202,47 +296,105 @@ class Core:
         """
         if cluster_name not in self._kafka_admin_clients:
             config = self.get_cluster_config(cluster_name)
-            kafka_config = dict(
-                bootstrap_servers=config.bootstrap_servers,
-                security_protocol=config.security_protocol,
-                ssl_cafile=config.ssl.cafile,
-                ssl_certfile=config.ssl.certfile,
-                ssl_keyfile=config.ssl.keyfile,
-                sasl_mechanism=config.sasl.mechanism,
-                sasl_plain_username=config.sasl.username,
-                sasl_plain_password=config.sasl.password,
-            )
-            self._kafka_admin_clients[cluster_name] = KafkaAdminClient(**kafka_config)
+            conn_key = self._connection_key(config)
+            admin_client = self._kafka_admin_clients_by_conn.get(conn_key)
+            if admin_client is None:
+                from kafka import KafkaAdminClient
+
+                admin_client = KafkaAdminClient(**config.admin_client_config, client_id='mcp-kafka-admin')
+                # Another thread (e.g. prewarm) may have connected meanwhile; keep the first client.
+                shared_client = self._kafka_admin_clients_by_conn.setdefault(conn_key, admin_client)
+                if shared_client is not admin_client:
+                    admin_client.close()
+                    admin_client = shared_client
+
+            self._kafka_admin_clients[cluster_name] = admin_client
 
         return self._kafka_admin_clients[cluster_name]
 
+    def prewarm(self):
+        """Connect the admin clients of all clusters in the background.
+
+        kafka-python connects lazily, so the first request to a cluster pays the
+        bootstrap and metadata latency. This starts the connections in worker
+        threads without waiting for them to finish.
+        """
+        cluster_names = self.clusters
+        if not cluster_names:
+            return
+
+        executor = ThreadPoolExecutor(
+            max_workers=min(32, len(cluster_names)),
+            thread_name_prefix='mcp-kafka-prewarm',
+        )
+        for cluster_name in cluster_names:
+            future = executor.submit(self.kafka_admin_client, cluster_name)
+            future.add_done_callback(functools.partial(self._log_prewarm_error, cluster_name))
+        executor.shutdown(wait=False)
+
+    @staticmethod
+    def _log_prewarm_error(cluster_name, future):
+        """Log a failed background connection attempt."""
+        if future.exception() is not None:
+            logger.warning(f"Failed to prewarm Kafka admin client for cluster {cluster_name}: {future.exception()}")
+
+    @staticmethod
+    def _connection_key(config: KafkaClusterConfig) -> tuple:
+        """Get the key identifying the physical connection of a cluster.
+
+        Clusters that point at the same brokers with the same credentials share
+        a single admin client.
+
+        Args:
+            config (KafkaClusterConfig): The cluster configuration.
+
+        Returns:
+            tuple: The connection key.
+        """
+        return (
+            tuple(sorted(config.bootstrap_servers)),
+            config.security_protocol,
+            config.ssl.cafile,
+            config.ssl.certfile,
+            config.ssl.keyfile,
+            config.sasl.mechanism,
+            config.sasl.username,
+            config.sasl.password,
+        )
+
     def close(self):
         """Graceful shutdown for MCP Core server."""
-        for cluster_name, admin_client in self._kafka_admin_clients.items():
-            logger.debug(f"Closing Kafka admin client for cluster: {cluster_name}")
+        for conn_key, admin_client in self._kafka_admin_clients_by_conn.items():
+            logger.debug(f"Closing Kafka admin client for brokers: {conn_key[0]}")
             admin_client.close()
 
+        self._kafka_admin_clients_by_conn.clear()
         self._kafka_admin_clients.clear()
 
 
-class CoreManager:
-    """Manager for the Core instance."""
-    _core: Core = None
+_CORE: Optional[Core] = None
 
-    @classmethod
-    def set_core(cls, core: Core):
-        """Set the core instance.
 
-        Args:
-            core (Core): The Core instance to set.
-        """
-        cls._core = core
+def set_core(core: Core):
+    """Set the core instance.
 
-    @classmethod
-    def get_core(cls) -> Core:
-        """Get the core instance.
+    Args:
+        core (Core): The Core instance to set.
+    """
+    global _CORE
+    _CORE = core
 
-        Returns:
-            Core: The Core instance.
-        """
-        return cls._core
+
+def get_core() -> Core:
+    """Get the core instance.
+
+    Returns:
+        Core: The Core instance.
+    """
+    return _CORE
+
+
+class CoreManager:
+    """Manager for the Core instance."""
+    set_core = staticmethod(set_core)
+    get_core = staticmethod(get_core)
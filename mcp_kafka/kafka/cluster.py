@@ -1,6 +1,10 @@
-from kafka.admin import ConfigResourceType, ConfigResource
+from typing import List
 
 from mcp_kafka.core import Core
+from mcp_kafka.utils.cache import TTLCache
+
+# Broker configs rarely change, so bursts of describe calls share one response.
+_describe_broker_cache = TTLCache(maxsize=256, ttl=30)
 
 
 class KafkaCluster:
@@ -10,6 +14,8 @@ class KafkaCluster:
         core (Core): An instance of the Core class.
     """
 
+    __slots__ = ('_core', '_kafka_admin_client')
+
     def __init__(self, core: Core, cluster_name: str):
         self._core = core
         self._kafka_admin_client = core.kafka_admin_client(cluster_name)
@@ -22,11 +28,39 @@ class KafkaCluster:
     def describe_broker(self, broker_id: str):
         """Fetch metadata for the specified broker"""
 
-        response = self._kafka_admin_client.describe_configs([
-            ConfigResource(
-                resource_type=ConfigResourceType.BROKER,
-                name=broker_id,
-            ),
-        ])
+        return self.describe_brokers([broker_id])[broker_id]
+
+    def describe_brokers(self, broker_ids: List[str]):
+        """Fetch metadata for the specified brokers with a single describe_configs call.
+
+        Arguments:
+            broker_ids (List[str]): The IDs of the brokers to describe.
+
+        Returns:
+            A dictionary mapping each broker ID to its config description.
+        """
+        result = {}
+        missing_broker_ids = []
+        for broker_id in broker_ids:
+            cached = _describe_broker_cache.get((self._kafka_admin_client, broker_id))
+            if cached is None:
+                missing_broker_ids.append(broker_id)
+            else:
+                result[broker_id] = cached
+
+        if missing_broker_ids:
+            from kafka.admin import ConfigResourceType, ConfigResource
+
+            response = self._kafka_admin_client.describe_configs([
+                ConfigResource(
+                    resource_type=ConfigResourceType.BROKER,
+                    name=broker_id,
+                )
+                for broker_id in missing_broker_ids
+            ])
+
+            for broker_id, broker_config in zip(missing_broker_ids, response):
+                _describe_broker_cache.set((self._kafka_admin_client, broker_id), broker_config)
+                result[broker_id] = broker_config
 
-        return response[0]
+        return result
@@ -1,10 +1,15 @@
+import operator
 from typing import List
 from mcp_kafka.core import Core
 
+_group_id = operator.itemgetter(0)
+
 
 class KafkaConsumer:
     """KafkaConsumer is a class that represents a Kafka consumer."""
 
+    __slots__ = ('_core', '_kafka_admin_client')
+
     def __init__(self, core: Core, cluster_name: str):
         self._core = core
         self._kafka_admin_client = core.kafka_admin_client(cluster_name)
@@ -18,8 +23,7 @@ class KafkaConsumer:
         """
 
         response = self._kafka_admin_client.list_consumer_groups(broker_ids=broker_ids)
-        consumer_groups = [group[0] for group in response]
-        return consumer_groups
+        return list(map(_group_id, response))
 
     def list_consumer_group_offsets(self, group_id: str):
         """List all consumer group offsets for a given consumer group.
@@ -30,6 +34,33 @@ class KafkaConsumer:
 
         return self._kafka_admin_client.list_consumer_group_offsets(group_id)
 
+    def list_consumer_group_offsets_many(self, group_ids: List[str]):
+        """List the consumer group offsets for several consumer groups at once.
+
+        The coordinator lookups and the OffsetFetch requests for all groups are
+        each sent together and awaited as one batch, so the call costs two round
+        trips no matter how many groups are requested.
+
+        Arguments:
+            group_ids: A list of consumer group IDs.
+
+        Returns:
+            A dictionary mapping each group ID to its consumer group offsets.
+        """
+        admin_client = self._kafka_admin_client
+        group_ids = list(dict.fromkeys(group_ids))
+        coordinator_ids = admin_client._find_coordinator_ids(group_ids)
+        futures = {
+            group_id: admin_client._list_consumer_group_offsets_send_request(group_id, coordinator_ids[group_id])
+            for group_id in group_ids
+        }
+        admin_client._wait_for_futures(list(futures.values()))
+
+        return {
+            group_id: admin_client._list_consumer_group_offsets_process_response(future.value)
+            for group_id, future in futures.items()
+        }
+
     def describe_consumer_groups(self, group_ids: List[str]):
         """Describe a consumer group.
 
@@ -1,10 +1,16 @@
-import itertools
+import os
 from typing import List
 
 from loguru import logger
-from kafka.admin import NewTopic, ConfigResourceType, ConfigResource
 
 from mcp_kafka.core import Core
+from mcp_kafka.utils.cache import TTLCache
+
+DESCRIBE_TOPICS_BATCH_SIZE = 10
+
+# Short-lived cache of topic metadata to absorb bursts of list/describe calls.
+# Topic configs are never cached, and any topic mutation clears it.
+_metadata_cache = TTLCache(maxsize=1024, ttl=int(os.getenv('MCP_KAFKA_META_TTL_MS', '2000')) / 1000)
 
 
 class KafkaTopic:
@@ -15,6 +21,8 @@ class KafkaTopic:
         core (Core): An instance of the Core class.
     """
 
+    __slots__ = ('_core', '_kafka_admin_client')
+
     def __init__(self, core: Core, cluster_name: str):
         self._core = core
         self._kafka_admin_client = core.kafka_admin_client(cluster_name)
@@ -29,11 +37,12 @@ class KafkaTopic:
     ):
         """Create a new topic."""
         if if_not_exists:
-            existing_topics = self._kafka_admin_client.list_topics()
-            if name in existing_topics:
+            if self._topic_exists(name):
                 logger.info(f"Topic {name} already exists. Skipping creation.")
                 return {}
 
+        from kafka.admin import NewTopic
+
         topic = NewTopic(
             name=name,
             num_partitions=num_partitions,
@@ -42,39 +51,97 @@ class KafkaTopic:
         )
 
         response = self._kafka_admin_client.create_topics([topic])
-        logger.debug('Create topic response:')
-        logger.debug(response)
+        _metadata_cache.clear()
+        logger.opt(lazy=True).debug('Create topic response: {}', lambda: response)
 
         return response
 
     def list_topics(self):
         """List all topics in the Kafka cluster."""
-        return self._kafka_admin_client.list_topics()
+        cache_key = (self._kafka_admin_client, 'list_topics')
+        topics = _metadata_cache.get(cache_key)
+        if topics is None:
+            topics = self._kafka_admin_client.list_topics()
+            _metadata_cache.set(cache_key, topics)
+
+        return topics
 
     def describe_topics(self,  topic_names: List[str],  include_topic_configs: bool = False):
         """Fetch metadata for the specified topics or all topics if None."""
         response = []
-        for topic_names_chunk in itertools.batched(topic_names, 10):
-            topics = self._kafka_admin_client.describe_topics(topic_names_chunk)
-            if include_topic_configs:
-                for topic in topics:
-                    response = self._kafka_admin_client.describe_configs(
-                        [ConfigResource(resource_type=ConfigResourceType.TOPIC, name=topic['topic'])])
-                    topic['configs'] = response[0]
+        for topics in self.describe_topics_paged(topic_names, include_topic_configs):
             response += topics
 
         return response
 
+    def describe_topics_paged(self, topic_names: List[str], include_topic_configs: bool = False):
+        """Fetch metadata for the specified topics one batch at a time.
+
+        Arguments:
+            topic_names (List[str]): The names of the topics to describe.
+            include_topic_configs (bool): If True, includes topic configurations in each description.
+
+        Yields:
+            A list of topic descriptions for each batch of topic names.
+        """
+        from kafka.admin import ConfigResourceType, ConfigResource
+
+        topic_names = tuple(topic_names)
+        for i in range(0, len(topic_names), DESCRIBE_TOPICS_BATCH_SIZE):
+            topic_names_chunk = topic_names[i:i + DESCRIBE_TOPICS_BATCH_SIZE]
+            topics = self._describe_topics_metadata(topic_names_chunk)
+            if include_topic_configs and topics:
+                configs_response = self._kafka_admin_client.describe_configs([
+                    ConfigResource(resource_type=ConfigResourceType.TOPIC, name=topic['topic'])
+                    for topic in topics
+                ])[0]
+                # Split the batched response back into one response per topic, keyed by resource name.
+                resources = {resource[3]: resource for resource in configs_response.resources}
+                topics = [
+                    dict(topic, configs=type(configs_response)(
+                        throttle_time_ms=configs_response.throttle_time_ms,
+                        resources=[resources[topic['topic']]],
+                    ))
+                    for topic in topics
+                ]
+            yield topics
+
+    def _topic_exists(self, name: str) -> bool:
+        """Check whether a topic exists with a metadata request for that topic only.
+
+        Any error other than LeaderNotAvailable is treated as "does not exist", so that
+        create_topics runs and surfaces the broker error (e.g. TopicAuthorizationFailed).
+        """
+        from kafka.errors import NoError, LeaderNotAvailableError
+
+        for topic in self._describe_topics_metadata((name,)):
+            if topic['topic'] == name:
+                return topic['error_code'] in (NoError.errno, LeaderNotAvailableError.errno)
+
+        return False
+
+    def _describe_topics_metadata(self, topic_names: tuple):
+        """Fetch metadata for the specified topics, served from the metadata cache if fresh."""
+        cache_key = (self._kafka_admin_client, 'describe_topics', topic_names)
+        topics = _metadata_cache.get(cache_key)
+        if topics is None:
+            topics = self._kafka_admin_client.describe_topics(topic_names)
+            _metadata_cache.set(cache_key, topics)
+
+        return topics
+
     def delete_topics(self, topics: List[str]):
         """Delete the specified topics."""
         response = self._kafka_admin_client.delete_topics(topics)
-        logger.debug('Delete topics response:')
-        logger.debug(response)
+        _metadata_cache.clear()
+        logger.opt(lazy=True).debug('Delete topics response: {}', lambda: response)
 
         return response
 
     def alter_topic(self, name: str, configs: dict):
         """Alter the specified topic."""
+        from kafka.admin import ConfigResourceType, ConfigResource
+
         config = ConfigResource(
             resource_type=ConfigResourceType.TOPIC,
             name=name,
@@ -82,7 +149,7 @@ class KafkaTopic:
         )
 
         response = self._kafka_admin_client.alter_configs([config])
-        logger.debug('Alter topic response:')
-        logger.debug(response)
+        _metadata_cache.clear()
+        logger.opt(lazy=True).debug('Alter topic response: {}', lambda: response)
 
         return response
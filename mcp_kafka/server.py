@@ -8,11 +8,12 @@ from contextlib import asynccontextmanager
 from loguru import logger
 from fastmcp import FastMCP
 
-from mcp_kafka.core import Core, CoreManager
+from mcp_kafka.core import Core, get_core, set_core
 from mcp_kafka.tools import (
     list_clusters,
     describe_cluster,
     describe_broker,
+    describe_brokers,
     create_topic,
     update_topic,
     list_topics,
@@ -20,6 +21,7 @@ from mcp_kafka.tools import (
     delete_topic,
     list_consumer_groups,
     list_consumer_group_offsets,
+    list_consumer_group_offsets_many,
     describe_consumer_groups,
     delete_consumer_group,
 )
@@ -37,7 +39,7 @@ async def server_lifespan(mcp: FastMCP):
         yield
     finally:
         logger.info('Server shutting down...')
-        core = CoreManager.get_core()
+        core = get_core()
         core.close()
         logger.info('Server shut down.')
 
@@ -48,6 +50,7 @@ mcp = FastMCP(name='mcp-kafka', lifespan=server_lifespan)
 mcp.tool(name='list_clusters')(list_clusters)
 mcp.tool(name='describe_cluster')(describe_cluster)
 mcp.tool(name='describe_broker')(describe_broker)
+mcp.tool(name='describe_brokers')(describe_brokers)
 mcp.tool(name='create_topic')(create_topic)
 mcp.tool(name='update_topic')(update_topic)
 mcp.tool(name='list_topics')(list_topics)
@@ -55,6 +58,7 @@ mcp.tool(name='describe_topics')(describe_topics)
 mcp.tool(name='delete_topic')(delete_topic)
 mcp.tool(name='list_consumer_groups')(list_consumer_groups)
 mcp.tool(name='list_consumer_group_offsets')(list_consumer_group_offsets)
+mcp.tool(name='list_consumer_group_offsets_many')(list_consumer_group_offsets_many)
 mcp.tool(name='describe_consumer_groups')(describe_consumer_groups)
 mcp.tool(name='delete_consumer_group')(delete_consumer_group)
 
@@ -62,7 +66,7 @@ mcp.tool(name='delete_consumer_group')(delete_consumer_group)
 def main():
     """Run the MCP server with CLI argument support."""
     core = Core.from_flags()
-    CoreManager.set_core(core)
+    set_core(core)
 
     # Log startup information
     logger.info('Starting MCP Kafka Server')
@@ -1,13 +1,129 @@
 
 """MCP Kafka tool handlers."""
+import asyncio
+import functools
+import threading
 from typing import List
 
 from loguru import logger
 from fastmcp import Context
 
-from mcp_kafka.core import CoreManager
+from mcp_kafka.core import get_core
 from mcp_kafka.kafka import KafkaCluster, KafkaTopic, KafkaConsumer
 
+_wrappers = {}
+_wrappers_lock = threading.Lock()
+
+
+def _get_wrapper(wrapper_cls, cluster_name: str):
+    """Get the shared wrapper of the given class for a cluster, creating it on first use.
+
+    Arguments:
+        wrapper_cls: One of KafkaCluster, KafkaTopic or KafkaConsumer.
+        cluster_name (str): The name of the cluster.
+
+    Returns:
+        The wrapper instance bound to the current core and cluster.
+    """
+    core = get_core()
+    key = (wrapper_cls, core, cluster_name)
+    wrapper = _wrappers.get(key)
+    if wrapper is None:
+        with _wrappers_lock:
+            wrapper = _wrappers.get(key)
+            if wrapper is None:
+                wrapper = _wrappers[key] = wrapper_cls(core, cluster_name)
+
+    return wrapper
+
+
+# Bounds the number of admin calls running in worker threads at once.
+_admin_call_semaphore = asyncio.Semaphore(8)
+_admin_client_locks = {}
+
+
+def _admin_client_lock(cluster_name: str) -> asyncio.Lock:
+    """Get the lock serializing calls to a cluster's admin client, which is not thread-safe.
+
+    The lock is keyed by the client's connection key, so clusters sharing a client share
+    the lock, and looking it up never builds the client on the event loop.
+
+    Arguments:
+        cluster_name (str): The name of the cluster.
+    """
+    core = get_core()
+    key = (core, core.admin_client_key(cluster_name))
+    return _admin_client_locks.setdefault(key, asyncio.Lock())
+
+
+def _call_wrapper_method(wrapper_cls, cluster_name: str, func, *args, **kwargs):
+    """Call a wrapper method on the cluster's shared wrapper.
+
+    Runs in the worker thread, since looking up the wrapper may build the admin client.
+
+    Arguments:
+        wrapper_cls: One of KafkaCluster, KafkaTopic or KafkaConsumer.
+        cluster_name (str): The name of the cluster.
+        func: The unbound wrapper method to call, e.g. KafkaTopic.list_topics.
+    """
+    return func(_get_wrapper(wrapper_cls, cluster_name), *args, **kwargs)
+
+
+async def _run_in_worker(cluster_name: str, func, *args, **kwargs):
+    """Run a blocking call against a cluster's admin client in a worker thread.
+
+    The admin client lock is taken before the semaphore, so calls queued behind a busy
+    client hold neither a semaphore slot nor a worker thread while other clusters run.
+
+    Arguments:
+        cluster_name (str): The name of the cluster the call goes to.
+        func: The blocking function to call.
+    """
+    async with _admin_client_lock(cluster_name):
+        async with _admin_call_semaphore:
+            return await asyncio.to_thread(func, *args, **kwargs)
+
+
+async def _run_admin_call(wrapper_cls, cluster_name: str, func, *args, **kwargs):
+    """Run a blocking wrapper method in a worker thread so it does not block the event loop.
+
+    Arguments:
+        wrapper_cls: One of KafkaCluster, KafkaTopic or KafkaConsumer.
+        cluster_name (str): The name of the cluster the call goes to.
+        func: The unbound wrapper method to call, e.g. KafkaTopic.list_topics.
+
+    Returns:
+        The return value of the wrapper method.
+    """
+    return await _run_in_worker(cluster_name, _call_wrapper_method, wrapper_cls, cluster_name, func, *args, **kwargs)
+
+
+def _handle_errors(operation: str):
+    """Wrap a tool handler's result as {'data': ...} and turn exceptions into {'error': ...}.
+
+    Arguments:
+        operation (str): What the handler does, used in the error message (e.g. 'listing topics').
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        async def wrapper(ctx: Context, *args, **kwargs):
+            try:
+                return {
+                    'data': await func(ctx, *args, **kwargs),
+                }
+            except Exception as e:
+                error_msg = f'Error {operation}: {str(e)}'
+                logger.error(error_msg)
+                await ctx.error(error_msg)
+
+                return {
+                    'error': error_msg,
+                }
+
+        return wrapper
+
+    return decorator
+
 
 def list_clusters(ctx: Context):
     """List all Kafka clusters.
@@ -22,7 +138,7 @@ def list_clusters(ctx: Context):
     Returns:
         A list of Kafka clusters with their names and descriptions.
     """
-    core = CoreManager.get_core()
+    core = get_core()
     result = []
 
     for cluster in core.clusters:
@@ -37,6 +153,7 @@ def list_clusters(ctx: Context):
     }
 
 
+@_handle_errors('describing cluster')
 async def describe_cluster(ctx: Context, cluster_name: str):
     """Fetch cluster-wide metadata such as the list of brokers, the controller ID, and the cluster ID.
 
@@ -51,24 +168,10 @@ async def describe_cluster(ctx: Context, cluster_name: str):
     Returns:
         A dictionary containing the cluster metadata.
     """
-    kafka_cluster = KafkaCluster(CoreManager.get_core(), cluster_name)
-
-    try:
-        response = kafka_cluster.describe_cluster()
-
-        return {
-            'data': response,
-        }
-    except Exception as e:
-        error_msg = f'Error describing cluster: {str(e)}'
-        logger.error(error_msg)
-        await ctx.error(error_msg)
-
-        return {
-            'error': error_msg,
-        }
+    return await _run_admin_call(KafkaCluster, cluster_name, KafkaCluster.describe_cluster)
 
 
+@_handle_errors('describing broker')
 async def describe_broker(ctx: Context, cluster_name: str, broker_id: str):
     """Fetch metadata for the specified broker.
 
@@ -84,24 +187,30 @@ async def describe_broker(ctx: Context, cluster_name: str, broker_id: str):
     Returns:
         A dictionary containing the broker metadata.
     """
-    kafka_cluster = KafkaCluster(CoreManager.get_core(), cluster_name)
+    return await _run_admin_call(KafkaCluster, cluster_name, KafkaCluster.describe_broker, broker_id)
+
 
-    try:
-        response = kafka_cluster.describe_broker(broker_id)
+@_handle_errors('describing brokers')
+async def describe_brokers(ctx: Context, cluster_name: str, broker_ids: List[str]):
+    """Fetch metadata for the specified brokers.
 
-        return {
-            'data': response,
-        }
-    except Exception as e:
-        error_msg = f'Error describing broker: {str(e)}'
-        logger.error(error_msg)
-        await ctx.error(error_msg)
+    ## Usage
+
+    Fetch metadata for several brokers at once. Prefer this over calling describe_broker
+    for each broker.
+
+    Arguments:
+        ctx: MCP context
+        cluster_name (str): The name of the cluster to describe.
+        broker_ids (List[str]): The IDs of the brokers to describe.
 
-        return {
-            'error': error_msg,
-        }
+    Returns:
+        A dictionary mapping each broker ID to its metadata.
+    """
+    return await _run_admin_call(KafkaCluster, cluster_name, KafkaCluster.describe_brokers, broker_ids)
 
 
+@_handle_errors('creating topic')
 async def create_topic(
     ctx: Context,
     cluster_name: str,
@@ -174,30 +283,19 @@ async def create_topic(
                 segment.ms
                 unclean.leader.election.enable
     """
-    kafka_topic = KafkaTopic(CoreManager.get_core(), cluster_name)
-
-    try:
-        response = kafka_topic.create_topic(
-            name,
-            num_partitions,
-            replication_factor,
-            if_not_exists,
-            configs,
-        )
-
-        return {
-            'data': response,
-        }
-    except Exception as e:
-        error_msg = f'Error creating topic: {str(e)}'
-        logger.error(error_msg)
-        await ctx.error(error_msg)
-
-        return {
-            'error': error_msg,
-        }
-
-
+    return await _run_admin_call(
+        KafkaTopic,
+        cluster_name,
+        KafkaTopic.create_topic,
+        name,
+        num_partitions,
+        replication_factor,
+        if_not_exists,
+        configs,
+    )
+
+
+@_handle_errors('listing topics')
 async def list_topics(ctx: Context, cluster_name: str):
     """List all topics in the Kafka cluster.
 
@@ -212,23 +310,10 @@ async def list_topics(ctx: Context, cluster_name: str):
     Returns:
         A list of topic names.
     """
-    kafka_topic = KafkaTopic(CoreManager.get_core(), cluster_name)
-
-    try:
-        response = kafka_topic.list_topics()
-        return {
-            'data': response,
-        }
-    except Exception as e:
-        error_msg = f'Error listing topics: {str(e)}'
-        logger.error(error_msg)
-        await ctx.error(error_msg)
-
-        return {
-            'error': error_msg,
-        }
+    return await _run_admin_call(KafkaTopic, cluster_name, KafkaTopic.list_topics)
 
 
+@_handle_errors('describing topic')
 async def describe_topics(
     ctx: Context,
     cluster_name: str,
@@ -250,24 +335,26 @@ async def describe_topics(
     Returns:
         A dictionary containing the topic descriptions.
     """
-    kafka_topic = KafkaTopic(CoreManager.get_core(), cluster_name)
-
-    try:
-        response = kafka_topic.describe_topics(topics, include_topic_configs)
-
-        return {
-            'data': response,
-        }
-    except Exception as e:
-        error_msg = f'Error describing topic: {str(e)}'
-        logger.error(error_msg)
-        await ctx.error(error_msg)
-
-        return {
-            'error': error_msg,
-        }
-
-
+    response = []
+    pages = await _run_admin_call(
+        KafkaTopic,
+        cluster_name,
+        KafkaTopic.describe_topics_paged,
+        topics,
+        include_topic_configs,
+    )
+    while True:
+        page = await _run_in_worker(cluster_name, next, pages, None)
+        if page is None:
+            break
+
+        response += page
+        await ctx.report_progress(len(response), len(topics))
+
+    return response
+
+
+@_handle_errors('updating topic')
 async def update_topic(ctx: Context, cluster_name: str, topic: str, configs: dict):
     """Update the specified topic.
 
@@ -281,24 +368,10 @@ async def update_topic(ctx: Context, cluster_name: str, topic: str, configs: dic
         topic (str): The name of the topic to update.
         configs (dict): A dictionary of configurations to update for the topic.
     """
-    kafka_topic = KafkaTopic(CoreManager.get_core(), cluster_name)
-
-    try:
-        response = kafka_topic.alter_topic(topic, configs)
-
-        return {
-            'data': response,
-        }
-    except Exception as e:
-        error_msg = f'Error updating topic: {str(e)}'
-        logger.error(error_msg)
-        await ctx.error(error_msg)
-
-        return {
-            'error': error_msg,
-        }
+    return await _run_admin_call(KafkaTopic, cluster_name, KafkaTopic.alter_topic, topic, configs)
 
 
+@_handle_errors('deleting topic')
 async def delete_topic(ctx: Context, cluster_name: str, topic: str):
     """Delete the specified topic.
 
@@ -311,24 +384,10 @@ async def delete_topic(ctx: Context, cluster_name: str, topic: str):
         cluster_name (str): The name of the cluster to delete the topic from.
         topic (str): The name of the topic to delete.
     """
-    kafka_topic = KafkaTopic(CoreManager.get_core(), cluster_name)
-
-    try:
-        response = kafka_topic.delete_topics([topic])
-
-        return {
-            'data': response,
-        }
-    except Exception as e:
-        error_msg = f'Error deleting topic: {str(e)}'
-        logger.error(error_msg)
-        await ctx.error(error_msg)
-
-        return {
-            'error': error_msg,
-        }
+    return await _run_admin_call(KafkaTopic, cluster_name, KafkaTopic.delete_topics, [topic])
 
 
+@_handle_errors('listing consumer groups')
 async def list_consumer_groups(ctx: Context, cluster_name: str, broker_ids=None):
     """List all consumer groups known to the cluster.
 
@@ -345,24 +404,10 @@ async def list_consumer_groups(ctx: Context, cluster_name: str, broker_ids=None)
     Returns:
         A list of consumer groups.
     """
-    kafka_cluster = KafkaConsumer(CoreManager.get_core(), cluster_name)
-
-    try:
-        response = kafka_cluster.list_consumer_groups(broker_ids=broker_ids)
-
-        return {
-            'data': response,
-        }
-    except Exception as e:
-        error_msg = f'Error listing consumer groups: {str(e)}'
-        logger.error(error_msg)
-        await ctx.error(error_msg)
-
-        return {
-            'error': error_msg,
-        }
+    return await _run_admin_call(KafkaConsumer, cluster_name, KafkaConsumer.list_consumer_groups, broker_ids=broker_ids)
 
 
+@_handle_errors('listing consumer group offsets')
 async def list_consumer_group_offsets(ctx: Context, cluster_name: str, group_id: str):
     """List all consumer group offsets for a given consumer group.
 
@@ -378,24 +423,30 @@ async def list_consumer_group_offsets(ctx: Context, cluster_name: str, group_id:
     Returns:
         A dictionary containing the consumer group offsets.
     """
-    kafka_cluster = KafkaConsumer(CoreManager.get_core(), cluster_name)
+    return await _run_admin_call(KafkaConsumer, cluster_name, KafkaConsumer.list_consumer_group_offsets, group_id)
 
-    try:
-        response = kafka_cluster.list_consumer_group_offsets(group_id)
 
-        return {
-            'data': response,
-        }
-    except Exception as e:
-        error_msg = f'Error listing consumer group offsets: {str(e)}'
-        logger.error(error_msg)
-        await ctx.error(error_msg)
+@_handle_errors('listing consumer group offsets')
+async def list_consumer_group_offsets_many(ctx: Context, cluster_name: str, group_ids: List[str]):
+    """List consumer group offsets for several consumer groups.
 
-        return {
-            'error': error_msg,
-        }
+    ## Usage
 
+    List consumer group offsets for several consumer groups at once. Prefer this over calling
+    list_consumer_group_offsets for each group.
 
+    Arguments:
+        ctx: MCP context
+        cluster_name (str): The name of the cluster to list consumer group offsets from.
+        group_ids (List[str]): The IDs of the consumer groups to list offsets for.
+
+    Returns:
+        A dictionary mapping each consumer group ID to its offsets.
+    """
+    return await _run_admin_call(KafkaConsumer, cluster_name, KafkaConsumer.list_consumer_group_offsets_many, group_ids)
+
+
+@_handle_errors('describing consumer group')
 async def describe_consumer_groups(ctx: Context, cluster_name: str, group_ids: List[str] = None):
     """Describe a list of consumer groups.
 
@@ -411,24 +462,10 @@ async def describe_consumer_groups(ctx: Context, cluster_name: str, group_ids: L
     Returns:
         A dictionary containing the consumer group description.
     """
-    kafka_cluster = KafkaConsumer(CoreManager.get_core(), cluster_name)
-
-    try:
-        response = kafka_cluster.describe_consumer_groups(group_ids)
-
-        return {
-            'data': response,
-        }
-    except Exception as e:
-        error_msg = f'Error describing consumer group: {str(e)}'
-        logger.error(error_msg)
-        await ctx.error(error_msg)
-
-        return {
-            'error': error_msg,
-        }
+    return await _run_admin_call(KafkaConsumer, cluster_name, KafkaConsumer.describe_consumer_groups, group_ids)
 
 
+@_handle_errors('deleting consumer groups')
 async def delete_consumer_group(ctx: Context, cluster_name: str, group_id: str):
     """Delete a consumer group.
 
@@ -444,19 +481,4 @@ async def delete_consumer_group(ctx: Context, cluster_name: str, group_id: str):
     Returns:
         A dictionary containing the result of the deletion.
     """
-    kafka_cluster = KafkaConsumer(CoreManager.get_core(), cluster_name)
-
-    try:
-        response = kafka_cluster.delete_consumer_group(group_id)
-
-        return {
-            'data': response,
-        }
-    except Exception as e:
-        error_msg = f'Error deleting consumer groups: {str(e)}'
-        logger.error(error_msg)
-        await ctx.error(error_msg)
-
-        return {
-            'error': error_msg,
-        }
+    return await _run_admin_call(KafkaConsumer, cluster_name, KafkaConsumer.delete_consumer_group, group_id)
@@ -1,35 +1,26 @@
+import functools
+import re
+
+
+@functools.lru_cache(maxsize=256)
+def _compile(quotes: tuple) -> re.Pattern:
+    quote = '|'.join(re.escape(q) for q in quotes) or '(?!)'
+    # Everything up to the first '=', optional whitespace, then a quoted value where
+    # a backslash-escaped quote does not terminate it. An unterminated value runs to the end.
+    return re.compile(
+        rf'[^=]*=\s*({quote})((?:\\\1|(?!\1).)*)(?:\1|\Z)',
+        re.DOTALL,
+    )
+
+
 def parse_value(key: str, text: str, quotes=('"', "'")) -> str:
     key_pos = text.find(key)
     if key_pos == -1:
         return ''
 
-    # Find the '=' after the key
-    eq_pos = text.find('=', key_pos + len(key))
-    if eq_pos == -1:
+    match = _compile(tuple(quotes)).match(text, key_pos + len(key))
+    if match is None:
         return ''
 
-    # Skip whitespace after '='
-    i = eq_pos + 1
-    while i < len(text) and text[i].isspace():
-        i += 1
-
-    # Check for quote character
-    if i >= len(text) or text[i] not in quotes:
-        return ''
-
-    quote_char = text[i]
-    i += 1
-    value = []
-
-    while i < len(text):
-        ch = text[i]
-        if ch == quote_char:
-            if value and value[-1] == '\\':
-                value[-1] = quote_char
-            else:
-                break
-        else:
-            value.append(ch)
-        i += 1
-
-    return ''.join(value)
+    quote_char = match.group(1)
+    return match.group(2).replace('\\' + quote_char, quote_char)
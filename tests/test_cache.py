@@ -0,0 +1,63 @@
+import pytest
+
+from mcp_kafka.utils import cache as cache_module
+from mcp_kafka.utils.cache import TTLCache
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(cache_module.time, 'monotonic', lambda: now[0])
+    return now
+
+
+def test_get_returns_default_for_missing_key():
+    cache = TTLCache(maxsize=2, ttl=10)
+
+    assert cache.get('missing') is None
+    assert cache.get('missing', 'default') == 'default'
+
+
+def test_entries_expire_after_ttl(clock):
+    cache = TTLCache(maxsize=2, ttl=10)
+    cache.set('key', 'value')
+
+    clock[0] += 9.9
+    assert cache.get('key') == 'value'
+
+    clock[0] += 0.1
+    assert cache.get('key') is None
+
+
+def test_set_refreshes_expiry(clock):
+    cache = TTLCache(maxsize=2, ttl=10)
+    cache.set('key', 'old')
+    clock[0] += 5
+    cache.set('key', 'new')
+
+    clock[0] += 9
+    assert cache.get('key') == 'new'
+
+
+def test_evicts_least_recently_used_entry():
+    cache = TTLCache(maxsize=2, ttl=10)
+    cache.set('a', 1)
+    cache.set('b', 2)
+    assert cache.get('a') == 1
+
+    cache.set('c', 3)
+
+    assert cache.get('a') == 1
+    assert cache.get('b') is None
+    assert cache.get('c') == 3
+
+
+def test_clear_removes_all_entries():
+    cache = TTLCache(maxsize=2, ttl=10)
+    cache.set('a', 1)
+    cache.set('b', 2)
+
+    cache.clear()
+
+    assert cache.get('a') is None
+    assert cache.get('b') is None
@@ -0,0 +1,39 @@
+import pytest
+from pydantic import ValidationError
+
+from mcp_kafka.core import Core, KafkaClusterConfig
+
+
+@pytest.mark.parametrize('bootstrap_servers, expected', [
+    ('h1:9092', ('h1:9092',)),
+    ('h1:9092,h2:9093', ('h1:9092', 'h2:9093')),
+    (' h1:9092 , h2:9093, ', ('h1:9092', 'h2:9093')),
+    (['h1:9092', 'h2:9093'], ('h1:9092', 'h2:9093')),
+])
+def test_bootstrap_servers_forms(bootstrap_servers, expected):
+    config = KafkaClusterConfig(bootstrap_servers=bootstrap_servers)
+
+    assert config.bootstrap_servers == expected
+    assert config.admin_client_config['bootstrap_servers'] == expected
+
+
+def test_bootstrap_servers_string_and_list_share_connection_key():
+    from_string = KafkaClusterConfig(bootstrap_servers='h2:9093,h1:9092')
+    from_list = KafkaClusterConfig(bootstrap_servers=['h1:9092', 'h2:9093'])
+
+    assert Core._connection_key(from_string) == Core._connection_key(from_list)
+
+
+def test_bootstrap_servers_is_required():
+    with pytest.raises(ValidationError):
+        KafkaClusterConfig()
+
+
+def test_admin_client_config_follows_model_copy():
+    config = KafkaClusterConfig(bootstrap_servers='a:1')
+    assert config.admin_client_config['security_protocol'] == 'PLAINTEXT'
+
+    copied = config.model_copy(update={'security_protocol': 'SSL'})
+
+    assert copied.admin_client_config['security_protocol'] == 'SSL'
+    assert config.admin_client_config['security_protocol'] == 'PLAINTEXT'
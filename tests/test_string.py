@@ -0,0 +1,71 @@
+import random
+
+import pytest
+
+from mcp_kafka.utils.string import parse_value
+
+
+def _reference_parse_value(key, text, quotes=('"', "'")):
+    # The character-by-character implementation parse_value replaced.
+    key_pos = text.find(key)
+    if key_pos == -1:
+        return ''
+
+    eq_pos = text.find('=', key_pos + len(key))
+    if eq_pos == -1:
+        return ''
+
+    i = eq_pos + 1
+    while i < len(text) and text[i].isspace():
+        i += 1
+
+    if i >= len(text) or text[i] not in quotes:
+        return ''
+
+    quote_char = text[i]
+    i += 1
+    value = []
+    while i < len(text):
+        ch = text[i]
+        if ch == quote_char:
+            if value and value[-1] == '\\':
+                value[-1] = quote_char
+            else:
+                break
+        else:
+            value.append(ch)
+        i += 1
+
+    return ''.join(value)
+
+
+@pytest.mark.parametrize('key, text, expected', [
+    ('username', 'username="alice"', 'alice'),
+    ('username', "username='alice'", 'alice'),
+    ('username', 'username = \n "alice" password="secret"', 'alice'),
+    ('password', 'username="alice" password="secret"', 'secret'),
+    ('password', 'password="a \\"quoted\\" word"', 'a "quoted" word'),
+    ('password', 'password="it\'s"', "it's"),
+    ('password', 'password="line1\nline2"', 'line1\nline2'),
+    ('password', 'password="unterminated', 'unterminated'),
+    ('password', 'password=""', ''),
+    ('password', 'password=secret', ''),
+    ('password', 'password', ''),
+    ('password', 'username="alice"', ''),
+])
+def test_parse_value(key, text, expected):
+    assert parse_value(key, text) == expected
+
+
+def test_parse_value_custom_quotes():
+    assert parse_value('key', 'key=|a"b|', quotes=('|',)) == 'a"b'
+    assert parse_value('key', 'key="ab"', quotes=('|',)) == ''
+    assert parse_value('key', 'key="ab"', quotes=()) == ''
+
+
+def test_parse_value_matches_reference_implementation():
+    rng = random.Random(0)
+    alphabet = 'k=\'"\\ \nab'
+    for _ in range(20000):
+        text = ''.join(rng.choice(alphabet) for _ in range(rng.randint(0, 12)))
+        assert parse_value('k', text) == _reference_parse_value('k', text), repr(text)
@@ -0,0 +1,62 @@
+import asyncio
+import inspect
+
+import pytest
+
+from mcp_kafka import core as core_module
+from mcp_kafka import tools
+from mcp_kafka.core import Core
+
+
+class FakeContext:
+    def __init__(self):
+        self.errors = []
+
+    async def error(self, message):
+        self.errors.append(message)
+
+
+@tools._handle_errors('doing things')
+async def handler(ctx, value, fail=False):
+    """Do things."""
+    if fail:
+        raise ValueError(f'bad value {value}')
+
+    return value * 2
+
+
+def test_handle_errors_wraps_result_as_data():
+    ctx = FakeContext()
+
+    assert asyncio.run(handler(ctx, 21)) == {'data': 42}
+    assert ctx.errors == []
+
+
+def test_handle_errors_turns_exception_into_error():
+    ctx = FakeContext()
+
+    result = asyncio.run(handler(ctx, 21, fail=True))
+
+    assert result == {'error': 'Error doing things: bad value 21'}
+    assert ctx.errors == ['Error doing things: bad value 21']
+
+
+def test_handle_errors_keeps_handler_metadata():
+    # FastMCP builds the tool schema from the handler's name, docstring and signature.
+    assert handler.__name__ == 'handler'
+    assert handler.__doc__ == 'Do things.'
+    assert list(inspect.signature(handler).parameters) == ['ctx', 'value', 'fail']
+
+
+@pytest.fixture
+def empty_core(monkeypatch):
+    monkeypatch.setattr(core_module, '_CORE', Core())
+
+
+def test_tool_reports_unknown_cluster_as_error(empty_core):
+    ctx = FakeContext()
+
+    result = asyncio.run(tools.describe_cluster(ctx, 'missing'))
+
+    assert result == {'error': "Error describing cluster: \"Cluster 'missing' not found in the configuration.\""}
+    assert ctx.errors == [result['error']]
@@ -0,0 +1,66 @@
+import pytest
+
+from mcp_kafka.kafka import topic as topic_module
+from mcp_kafka.kafka.topic import KafkaTopic
+
+
+class FakeAdminClient:
+    def __init__(self, error_code):
+        self.error_code = error_code
+        self.created_topics = []
+
+    def describe_topics(self, topics):
+        return [{'topic': topic, 'error_code': self.error_code, 'partitions': []} for topic in topics]
+
+    def create_topics(self, new_topics):
+        self.created_topics += [new_topic.name for new_topic in new_topics]
+        return 'created'
+
+
+class FakeCore:
+    def __init__(self, admin_client):
+        self.admin_client = admin_client
+
+    def kafka_admin_client(self, cluster_name):
+        return self.admin_client
+
+
+@pytest.fixture(autouse=True)
+def clear_metadata_cache():
+    topic_module._metadata_cache.clear()
+    yield
+    topic_module._metadata_cache.clear()
+
+
+def make_topic(error_code):
+    admin_client = FakeAdminClient(error_code)
+    return KafkaTopic(FakeCore(admin_client), 'cluster'), admin_client
+
+
+@pytest.mark.parametrize('error_code, exists', [
+    (0, True),    # NoError
+    (5, True),    # LeaderNotAvailable: the topic exists, its leader is being elected
+    (3, False),   # UnknownTopicOrPartition
+    (17, False),  # InvalidTopic
+    (29, False),  # TopicAuthorizationFailed
+])
+def test_topic_exists_error_codes(error_code, exists):
+    kafka_topic, _ = make_topic(error_code)
+
+    assert kafka_topic._topic_exists('orders') is exists
+
+
+@pytest.mark.parametrize('error_code', [0, 5])
+def test_create_topic_if_not_exists_skips_existing_topic(error_code):
+    kafka_topic, admin_client = make_topic(error_code)
+
+    assert kafka_topic.create_topic('orders', if_not_exists=True) == {}
+    assert admin_client.created_topics == []
+
+
+@pytest.mark.parametrize('error_code', [3, 17, 29])
+def test_create_topic_if_not_exists_surfaces_other_errors(error_code):
+    kafka_topic, admin_client = make_topic(error_code)
+
+    assert kafka_topic.create_topic('orders', if_not_exists=True) == 'created'
+    assert admin_client.created_topics == ['orders']